@@ -1,19 +1,22 @@
 import streamlit as st
 import os
 import base64
+from functools import lru_cache
 
 def display_header():
     """Display Roy's logo, header and subtitle"""
     # Assuming your assets folder is at the root of your project
     image_path = "assets/roy.png"  # Update this path to match your image's location
     
+    logo_uri = _logo_data_uri(image_path)
+    
     # Check if the image exists
-    if os.path.exists(image_path):
+    if logo_uri:
         # Use HTML/CSS for more precise control over the image size and centering
         st.markdown(
             f"""
             <div style="display: flex; justify-content: center; margin-bottom: 30px;">
-                <img src="data:image/png;base64,{get_base64_encoded_image(image_path)}" 
+                <img src="{logo_uri}" 
                      style="width: 250px; height: auto;" alt="Roy - AI Launch Advisor">
             </div>
             """,
@@ -35,6 +38,13 @@ def display_header():
     st.markdown('<div class="main-header">Launch Smarter with Roy</div>', unsafe_allow_html=True)
     st.markdown('<div class="subtitle">I\'ve studied the strategies behind thousands of launches. Let\'s create one that gets your startup seen, trusted, and funded.</div>', unsafe_allow_html=True)
 
+@lru_cache(maxsize=4)
+def _logo_data_uri(image_path):
+    """Return the logo as a data URI, or an empty string if the file is missing"""
+    if not os.path.exists(image_path):
+        return ""
+    return "data:image/png;base64," + get_base64_encoded_image(image_path)
+
 def get_base64_encoded_image(image_path):
     """Convert an image to base64 encoding for embedding in HTML"""
     with open(image_path, "rb") as image_file:
@@ -1,9 +1,11 @@
 import streamlit as st
-from utils.calendar_integration import milestone_calendar_ui
-from utils.state_management import reset_form
+from utils.state_management import reset_form, set_show_calendar
 
 def display_calendar():
     """Display calendar scheduling interface"""
+    # Import calendar integration here so earlier steps don't load it
+    from utils.calendar_integration import milestone_calendar_ui
+    
     plan = st.session_state.generated_plan
     
     if not plan:
@@ -13,12 +15,6 @@ def display_calendar():
         return
     
     st.markdown('<div class="result-card">', unsafe_allow_html=True)
-    st.markdown('<div class="result-header">', unsafe_allow_html=True)
-    st.markdown('<h2>Schedule Your Launch Milestones</h2>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Display summary of the plan - with error handling
-    st.markdown('<div class="summary-box">', unsafe_allow_html=True)
     
     # Check if the expected keys exist and display safely
     startup_name = plan.get('startup_name', 'Your Startup')
@@ -31,8 +27,18 @@ def display_calendar():
         launch_type = plan['launch_summary'].get('launch_type', 'Launch')
         funding_status = plan['launch_summary'].get('funding_status', 'Funding')
     
-    st.markdown(f"<p><strong>{startup_name}</strong> - {launch_type} ({funding_status})</p>", unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
+    # Display header and summary of the plan in a single block
+    st.markdown(
+        f"""
+        <div class="result-header">
+            <h2>Schedule Your Launch Milestones</h2>
+        </div>
+        <div class="summary-box">
+            <p><strong>{startup_name}</strong> - {launch_type} ({funding_status})</p>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
     
     # Calendar UI
     milestone_calendar_ui(st.session_state.form_data['email'], plan)
@@ -41,13 +47,9 @@ def display_calendar():
     col1, col2 = st.columns([1, 1])
     
     with col1:
-        if st.button("← Back to Launch Plan", use_container_width=True):
-            st.session_state.show_calendar = False
-            st.experimental_rerun()
+        st.button("← Back to Launch Plan", use_container_width=True, on_click=set_show_calendar, args=(False,))
     
     with col2:
-        if st.button("Continue", use_container_width=True):
-            st.session_state.show_calendar = False
-            st.experimental_rerun()
+        st.button("Continue", use_container_width=True, on_click=set_show_calendar, args=(False,))
     
     st.markdown('</div>', unsafe_allow_html=True)
\ No newline at end of file
@@ -1,9 +1,141 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st
 from utils.ui_components import option_selector, step_navigation, step_card, info_box
 from utils.competitive_analysis import get_industries
-from utils.plan_generator import generate_launch_plan
 from utils.state_management import reset_form
-from utils.data_loader import load_strategies
+from utils.data_loader import load_strategies, plan_cache_key, load_cached_plan, save_cached_plan
+
+# Minimal email shape check: something@domain.tld with no whitespace
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Answer options for each question step
+STEP2_OPTIONS = (
+    "✅ Yes, I've gotten direct feedback on my messaging",
+    "🤔 Sort of... I've talked to people, but nothing structured",
+    "❌ No, I haven't tested it yet"
+)
+
+STEP3_OPTIONS = (
+    "🚀 New Startup/Product Launch",
+    "🔄 Brand Repositioning (Rebrand or Pivot)",
+    "💰 Funding Announcement",
+    "📢 Major Partnership or Publicity Push"
+)
+
+STEP4_OPTIONS = (
+    "🚀 Bootstrapping (No external funding, self-funded)",
+    "🌱 Raised under $1M (Likely still raising, early-stage)",
+    "📈 Raised $1M-$3M (Have 12-18 months of runway)",
+    "🏆 Raised $3M+ (Series A+; established growth strategy)"
+)
+
+STEP5_OPTIONS = (
+    "🚀 Get Users or Customers",
+    "💰 Attract Investors",
+    "🎙 Build Press & Awareness",
+    "🌎 Create Industry Influence"
+)
+
+STEP6_OPTIONS = (
+    "✅ Yes, we have an engaged community",
+    "⚡ We have a small following but need more traction",
+    "❌ No, we're starting from scratch"
+)
+
+STEP7_OPTIONS = (
+    "📈 Scaling & repeatable traction (growth systems)",
+    "💰 Investor relations & positioning for next raise",
+    "🛠 Optimizing based on customer feedback",
+    "🔥 Sustaining press & industry visibility"
+)
+
+STEP9_OPTIONS = (
+    "✅ Yes, help me plan my launch timeline",
+    "⏭️ Skip calendar scheduling for now"
+)
+
+# Form fields that generate_ai_launch_plan reads; the plan caches are keyed on these only,
+# so answers that differ just in email or industry share a cached plan. Only successful
+# AI plans are cached, so a failed call never leaks a fallback plan to other users
+PLAN_INPUT_KEYS = (
+    'first_name',
+    'startup_name',
+    'messaging_tested',
+    'launch_type',
+    'funding_status',
+    'primary_goal',
+    'audience_readiness',
+    'post_launch_priority'
+)
+
+# Emoji prefixes for the industry options in step 8
+INDUSTRY_EMOJIS = {
+    "SaaS": "💻",
+    "D2C / E-commerce": "🛒",
+    "Fintech": "💰",
+    "Healthcare": "🏥",
+    "Enterprise Software": "🏢",
+    "AI/ML": "🤖",
+    "Service": "🛎️",
+    "Other": "🔍"  # Added "Other" option with magnifying glass emoji
+}
+
+@st.cache_data(show_spinner=False)
+def _industry_options():
+    """
+    Build the step 8 industry options once and cache them across reruns
+    
+    Returns:
+        tuple: (options, option_to_industry) where options are the emoji-prefixed
+            labels, ending with "Other", and option_to_industry maps each label
+            back to its plain industry name
+    """
+    industries = [*get_industries(), "Other"]
+    options = tuple(f"{INDUSTRY_EMOJIS.get(industry, '🔍')} {industry}" for industry in industries)
+    return options, dict(zip(options, industries))
+
+@st.cache_data(show_spinner=False, ttl=60 * 60)
+def _cached_plan(form_items):
+    """
+    Generate the AI launch plan for a frozen tuple of PLAN_INPUT_KEYS answers, cached across sessions
+    
+    AI errors propagate to the caller; st.cache_data does not cache raised exceptions,
+    so only successful AI plans are memoized.
+    """
+    # Import plan generator here so the OpenAI client only loads once a plan is requested
+    from utils.plan_generator import generate_ai_launch_plan
+    
+    form_data = dict(form_items)
+    
+    # Reuse an AI plan persisted by an earlier server process if there is one;
+    # static fallback plans saved before they were kept out of the cache lack
+    # the raw AI output and are regenerated
+    key = plan_cache_key(form_data)
+    plan = load_cached_plan(key)
+    if plan is None or 'ai_generated_plan' not in plan:
+        # Load strategies from the utility function
+        external_strategies = load_strategies()
+        plan = generate_ai_launch_plan(form_data, external_strategies)
+        save_cached_plan(key, plan)
+    return plan
+
+def _generate_plan(form_items):
+    """
+    Return the cached AI plan, or an uncached static plan if the AI call fails
+    
+    Importing utils.plan_generator reads the OpenAI key from st.secrets, so missing
+    credentials raise here rather than falling back to the static plan.
+    """
+    from utils.plan_generator import generate_static_launch_plan
+    
+    try:
+        return _cached_plan(form_items)
+    except Exception as e:
+        st.error(f"Error using AI generation: {e}")
+        # Fall back to static generation if AI generation fails
+    
+    return generate_static_launch_plan(dict(form_items), load_strategies())
 
 def step_1():
     """Collect basic information"""
@@ -12,20 +144,25 @@ def step_1():
         
         with col1:
             first_name = st.text_input("First Name", value=st.session_state.form_data['first_name'], 
-                                    placeholder="Your first name")
+                                    placeholder="Your first name", key="first_name_input")
         
         with col2:
             email = st.text_input("Email", value=st.session_state.form_data['email'],
-                                placeholder="your@email.com")
+                                placeholder="your@email.com", key="email_input")
         
         startup_name = st.text_input("Startup Name", value=st.session_state.form_data['startup_name'],
-                                   placeholder="Your startup's name")
+                                   placeholder="Your startup's name", key="startup_name_input")
         
         next_disabled = not first_name or not email or not startup_name
         
         def on_next():
+            # Runs as a button callback, so read the latest input values from session state
+            first_name = st.session_state.first_name_input
+            startup_name = st.session_state.startup_name_input
+            email = st.session_state.email_input.strip()
+            
             # Validate inputs
-            if "@" not in email or "." not in email:
+            if not EMAIL_RE.match(email):
                 st.error("Please enter a valid email address.")
                 return
                 
@@ -33,7 +170,6 @@ def step_1():
             st.session_state.form_data['startup_name'] = startup_name
             st.session_state.form_data['email'] = email
             st.session_state.step += 1
-            st.experimental_rerun()
         
         step_navigation(back=False, next_disabled=next_disabled, on_next=on_next)
     
@@ -44,18 +180,11 @@ def step_2():
     def content():
         info_box("Before we dive in, have you tested your messaging with real customers?")
         
-        options = [
-            "✅ Yes, I've gotten direct feedback on my messaging",
-            "🤔 Sort of... I've talked to people, but nothing structured",
-            "❌ No, I haven't tested it yet"
-        ]
-        
-        selected = option_selector(options, "messaging", st.session_state.form_data['messaging_tested'])
+        selected = option_selector(STEP2_OPTIONS, "messaging", st.session_state.form_data['messaging_tested'])
         
         def on_next():
             st.session_state.form_data['messaging_tested'] = selected
             st.session_state.step += 1
-            st.experimental_rerun()
             
         step_navigation(next_disabled=not selected, on_next=on_next)
     
@@ -64,15 +193,8 @@ def step_2():
 def step_3():
     """Ask about launch type"""
     def content():
-        options = [
-            "🚀 New Startup/Product Launch",
-            "🔄 Brand Repositioning (Rebrand or Pivot)",
-            "💰 Funding Announcement",
-            "📢 Major Partnership or Publicity Push"
-        ]
-        
         selected = option_selector(
-            options, 
+            STEP3_OPTIONS, 
             "launch", 
             st.session_state.form_data['launch_type'],
             with_info=True
@@ -81,7 +203,6 @@ def step_3():
         def on_next():
             st.session_state.form_data['launch_type'] = selected
             st.session_state.step += 1
-            st.experimental_rerun()
             
         step_navigation(next_disabled=not selected, on_next=on_next)
     
@@ -92,19 +213,11 @@ def step_4():
     def content():
         info_box("Where are you financially right now?")
         
-        options = [
-            "🚀 Bootstrapping (No external funding, self-funded)",
-            "🌱 Raised under $1M (Likely still raising, early-stage)",
-            "📈 Raised $1M-$3M (Have 12-18 months of runway)",
-            "🏆 Raised $3M+ (Series A+; established growth strategy)"
-        ]
-        
-        selected = option_selector(options, "funding", st.session_state.form_data['funding_status'])
+        selected = option_selector(STEP4_OPTIONS, "funding", st.session_state.form_data['funding_status'])
         
         def on_next():
             st.session_state.form_data['funding_status'] = selected
             st.session_state.step += 1
-            st.experimental_rerun()
             
         step_navigation(next_disabled=not selected, on_next=on_next)
     
@@ -113,15 +226,8 @@ def step_4():
 def step_5():
     """Ask about primary launch goal"""
     def content():
-        options = [
-            "🚀 Get Users or Customers",
-            "💰 Attract Investors",
-            "🎙 Build Press & Awareness",
-            "🌎 Create Industry Influence"
-        ]
-        
         selected = option_selector(
-            options, 
+            STEP5_OPTIONS, 
             "goal", 
             st.session_state.form_data['primary_goal'],
             with_info=True
@@ -130,7 +236,6 @@ def step_5():
         def on_next():
             st.session_state.form_data['primary_goal'] = selected
             st.session_state.step += 1
-            st.experimental_rerun()
             
         step_navigation(next_disabled=not selected, on_next=on_next)
     
@@ -139,14 +244,8 @@ def step_5():
 def step_6():
     """Ask about audience readiness"""
     def content():
-        options = [
-            "✅ Yes, we have an engaged community",
-            "⚡ We have a small following but need more traction",
-            "❌ No, we're starting from scratch"
-        ]
-        
         selected = option_selector(
-            options, 
+            STEP6_OPTIONS, 
             "audience", 
             st.session_state.form_data['audience_readiness'],
             with_info=True
@@ -155,7 +254,6 @@ def step_6():
         def on_next():
             st.session_state.form_data['audience_readiness'] = selected
             st.session_state.step += 1
-            st.experimental_rerun()
             
         step_navigation(next_disabled=not selected, on_next=on_next)
     
@@ -170,15 +268,8 @@ def step_7():
             'the post-launch phase to maximize your momentum and impact.'
         )
         
-        options = [
-            "📈 Scaling & repeatable traction (growth systems)",
-            "💰 Investor relations & positioning for next raise",
-            "🛠 Optimizing based on customer feedback",
-            "🔥 Sustaining press & industry visibility"
-        ]
-        
         selected = option_selector(
-            options, 
+            STEP7_OPTIONS, 
             "priority", 
             st.session_state.form_data['post_launch_priority'],
             with_info=True
@@ -187,7 +278,6 @@ def step_7():
         def on_next():
             st.session_state.form_data['post_launch_priority'] = selected
             st.session_state.step += 1
-            st.experimental_rerun()
             
         step_navigation(next_disabled=not selected, on_next=on_next)
     
@@ -201,28 +291,8 @@ def step_8():
             'Select your industry to see examples of successful launches from companies like yours.'
         )
         
-        # Get available industries
-        industries = get_industries()
-        
-        # Create options with emojis
-        industry_emojis = {
-            "SaaS": "💻",
-            "D2C / E-commerce": "🛒",
-            "Fintech": "💰",
-            "Healthcare": "🏥",
-            "Enterprise Software": "🏢",
-            "AI/ML": "🤖",
-            "Service": "🛎️",
-            "Other": "🔍"  # Added "Other" option with magnifying glass emoji
-        }
-        
-        options = []
-        for industry in industries:
-            emoji = industry_emojis.get(industry, "🔍")
-            options.append(f"{emoji} {industry}")
-        
-        # Add "Other" option at the end
-        options.append(f"{industry_emojis['Other']} Other")
+        # Get available industries as emoji-prefixed options, with "Other" at the end
+        options, option_to_industry = _industry_options()
         
         selected = option_selector(options, "industry", st.session_state.form_data['industry'])
         
@@ -232,20 +302,21 @@ def step_8():
             other_industry = st.text_input("Please specify your industry:", key="other_industry_input")
         
         def on_next():
+            # Runs as a button callback, so read the latest input value from session state
+            other_industry = st.session_state.get("other_industry_input")
+            
             # Extract industry name without emoji
             if selected:
                 if "Other" in selected and other_industry:
                     # Use the user's custom industry input
                     st.session_state.form_data['industry'] = other_industry
                 else:
-                    # Use the selected predefined industry (remove emoji)
-                    industry = selected.split(" ", 1)[1] if " " in selected else selected
-                    st.session_state.form_data['industry'] = industry
+                    # Use the selected predefined industry (without emoji)
+                    st.session_state.form_data['industry'] = option_to_industry.get(selected, selected)
             else:
                 st.session_state.form_data['industry'] = None
                 
             st.session_state.step += 1
-            st.experimental_rerun()  # Changed from st.st.experimental_rerun() to st.experimental_rerun()
         
         # Next button should be disabled if "Other" is selected but no text is entered
         next_is_disabled = not selected or ("Other" in selected and not other_industry)
@@ -263,12 +334,7 @@ def step_9():
             'Would you like us to create a suggested launch timeline with key milestones for your calendar?'
         )
         
-        options = [
-            "✅ Yes, help me plan my launch timeline",
-            "⏭️ Skip calendar scheduling for now"
-        ]
-        
-        selected = option_selector(options, "calendar", None)
+        selected = option_selector(STEP9_OPTIONS, "calendar", None)
         
         def on_generate_plan():
             # Generate plan
@@ -276,28 +342,23 @@ def step_9():
                 # Import EngageBay integration
                 from utils.engagebay_integration import send_to_engagebay
                 
-                # Load strategies from the utility function
-                external_strategies = load_strategies()
-                st.session_state.generated_plan = generate_launch_plan(
-                    st.session_state.form_data, 
-                    external_strategies
-                )
-                
-                # Send contact info to EngageBay
                 first_name = st.session_state.form_data.get('first_name', '')
                 email = st.session_state.form_data.get('email', '')
                 
-                if email:
-                    # Send to EngageBay in the background
-                    send_to_engagebay(first_name, email)
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    # Send contact info to EngageBay in the background while the plan is generated
+                    if email:
+                        executor.submit(send_to_engagebay, first_name, email)
+                    
+                    # Reuse the plan for identical answers instead of regenerating it
+                    form_items = tuple((key, st.session_state.form_data[key]) for key in PLAN_INPUT_KEYS)
+                    st.session_state.generated_plan = _generate_plan(form_items)
                 
                 # Set calendar preference
-                if selected == "✅ Yes, help me plan my launch timeline":
+                if selected == STEP9_OPTIONS[0]:
                     st.session_state.show_calendar = True
                 else:
                     st.session_state.show_calendar = False
-                    
-            st.experimental_rerun()
             
         step_navigation(
             next_label="Generate My Launch Plan", 
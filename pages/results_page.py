@@ -1,11 +1,26 @@
 import streamlit as st
-from utils.email_sender import send_email_to_user as send_email
-from utils.competitive_analysis import display_competitive_analysis
 from utils.ui_components import pricing_section, display_user_responses_summary
-from utils.state_management import reset_form
+from utils.state_management import reset_form, set_show_calendar
+
+def _numbered_item_body(item, default_title):
+    """Return the inner HTML for a strategy or next step in either string or dictionary format"""
+    if isinstance(item, dict):
+        return f"<div><p><strong>{item.get('title', default_title)}</strong></p><p>{item.get('description', '')}</p></div>"
+    return f"<p>{item}</p>"
+
+def _numbered_items_html(items, number_class, default_title):
+    """Build the HTML for a numbered list of strategies or next steps as a single block"""
+    return "\n".join(
+        f'<div class="strategy-item"><div class="{number_class}">{i}</div>{_numbered_item_body(item, default_title)}</div>'
+        for i, item in enumerate(items, 1)
+    )
 
 def display_results():
     """Display the launch plan results page"""
+    # Import results-only dependencies here so earlier steps don't load them
+    from utils.email_sender import send_email_to_user as send_email
+    from utils.competitive_analysis import display_competitive_analysis
+    
     try:
         plan = st.session_state.generated_plan
         
@@ -16,13 +31,6 @@ def display_results():
             return
         
         st.markdown('<div class="result-card">', unsafe_allow_html=True)
-        st.markdown('<div class="result-header">', unsafe_allow_html=True)
-        st.markdown(f'<h2>Your Launch Plan, {plan.get("first_name", "")}</h2>', unsafe_allow_html=True)
-        st.markdown('<span class="ready-badge">Ready to Launch</span>', unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Summary box
-        st.markdown('<div class="summary-box">', unsafe_allow_html=True)
         
         # Safely access nested dictionaries with get() and provide fallbacks
         launch_type = "Launch"
@@ -39,10 +47,20 @@ def display_results():
             # Direct access if not nested in launch_summary
             funding_status = plan.get("funding_status", funding_status)
         
-        st.markdown(f'<p style="font-weight: 500;">{funding_status}</p>', unsafe_allow_html=True)
-        st.markdown(f'<p>Launch Type: <strong>{launch_type}</strong></p>', unsafe_allow_html=True)
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+        # Header and summary box
+        st.markdown(
+            f"""
+            <div class="result-header">
+                <h2>Your Launch Plan, {plan.get("first_name", "")}</h2>
+                <span class="ready-badge">Ready to Launch</span>
+            </div>
+            <div class="summary-box">
+                <p style="font-weight: 500;">{funding_status}</p>
+                <p>Launch Type: <strong>{launch_type}</strong></p>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
         
         # Strategies section
         st.markdown("<h3>Your Launch Strategies</h3>", unsafe_allow_html=True)
@@ -55,18 +73,8 @@ def display_results():
             strategies = plan.get("recommended_strategies", [])
         
         if strategies:
-            for i, strategy in enumerate(strategies[:5]):  # Limit to 5 strategies
-                st.markdown('<div class="strategy-item">', unsafe_allow_html=True)
-                st.markdown(f'<div class="strategy-number">{i+1}</div>', unsafe_allow_html=True)
-                
-                # Handle both string and dictionary formats for strategies
-                if isinstance(strategy, dict):
-                    st.markdown(f"<p><strong>{strategy.get('title', 'Strategy')}</strong></p>", unsafe_allow_html=True)
-                    st.markdown(f"<p>{strategy.get('description', '')}</p>", unsafe_allow_html=True)
-                else:
-                    st.markdown(f"<p>{strategy}</p>", unsafe_allow_html=True)
-                
-                st.markdown('</div>', unsafe_allow_html=True)
+            # Limit to 5 strategies
+            st.markdown(_numbered_items_html(strategies[:5], "strategy-number", "Strategy"), unsafe_allow_html=True)
         else:
             st.info("No specific strategies were generated. Try adjusting your inputs and generating a new plan.")
         
@@ -79,18 +87,8 @@ def display_results():
             next_steps = plan.get("next_steps", [])
         
         if next_steps:
-            for i, step in enumerate(next_steps[:3]):  # Limit to 3 next steps
-                st.markdown('<div class="strategy-item">', unsafe_allow_html=True)
-                st.markdown(f'<div class="next-step-number">{i+1}</div>', unsafe_allow_html=True)
-                
-                # Handle both string and dictionary formats for next steps
-                if isinstance(step, dict):
-                    st.markdown(f"<p><strong>{step.get('title', 'Next Step')}</strong></p>", unsafe_allow_html=True)
-                    st.markdown(f"<p>{step.get('description', '')}</p>", unsafe_allow_html=True)
-                else:
-                    st.markdown(f"<p>{step}</p>", unsafe_allow_html=True)
-                
-                st.markdown('</div>', unsafe_allow_html=True)
+            # Limit to 3 next steps
+            st.markdown(_numbered_items_html(next_steps[:3], "next-step-number", "Next Step"), unsafe_allow_html=True)
         else:
             st.info("No specific next steps were generated. Try adjusting your inputs and generating a new plan.")
         
@@ -133,9 +131,7 @@ def display_results():
                 st.success("Plan sent to your email!")
         
         with col2:
-            if st.button("Schedule in Calendar", use_container_width=True):
-                st.session_state.show_calendar = True
-                st.experimental_rerun()
+            st.button("Schedule in Calendar", use_container_width=True, on_click=set_show_calendar, args=(True,))
         
         # Pricing section
         st.markdown("<h3>Get Additional Support</h3>", unsafe_allow_html=True)
@@ -1,5 +1,4 @@
 import streamlit as st
-from datetime import datetime
 
 
 
@@ -18,13 +17,30 @@ from pages.results_page import display_results
 from pages.calendar_page import display_calendar
 
 # Import utilities
-from utils.state_management import reset_form
-from utils.data_loader import load_strategies
+from utils.state_management import init_session_state
 
 
 
 
 
+# Form step handlers, keyed by step number
+STEP_FUNCS = {
+    1: step_1,
+    2: step_2,
+    3: step_3,
+    4: step_4,
+    5: step_5,
+    6: step_6,
+    7: step_7,
+    8: step_8,
+    9: step_9
+}
+
+# Progress bar value and label for each step, indexed by step number
+N_STEPS = len(STEP_FUNCS)
+STEP_PROGRESS = tuple((step - 1) / (N_STEPS - 1) for step in range(N_STEPS + 1))
+STEP_LABELS = tuple(f"**Step {step}/{N_STEPS}**" for step in range(N_STEPS + 1))
+
 # Set page configuration
 st.set_page_config(
     page_title="Roy",
@@ -37,31 +53,7 @@ st.set_page_config(
 apply_css()
 
 # Initialize session state
-if 'step' not in st.session_state:
-    st.session_state.step = 1
-
-if 'form_data' not in st.session_state:
-    st.session_state.form_data = {
-        'first_name': '',
-        'startup_name': '',
-        'messaging_tested': None,
-        'launch_type': None,
-        'funding_status': None,
-        'primary_goal': None,
-        'audience_readiness': None,
-        'post_launch_priority': None,
-        'industry': None,
-        'email': ''
-    }
-
-if 'generated_plan' not in st.session_state:
-    st.session_state.generated_plan = None
-    
-if 'email_sent' not in st.session_state:
-    st.session_state.email_sent = False
-
-if 'show_calendar' not in st.session_state:
-    st.session_state.show_calendar = False
+init_session_state()
 
 # Main app
 def main():
@@ -69,10 +61,9 @@ def main():
     display_header()
     
     # Progress bar (only show if not on results page)
-    if st.session_state.generated_plan is None and 1 <= st.session_state.step <= 9:
-        progress = (st.session_state.step - 1) / 8
-        st.progress(progress)
-        st.markdown(f"**Step {st.session_state.step}/9**")
+    if st.session_state.generated_plan is None and 1 <= st.session_state.step <= N_STEPS:
+        st.progress(STEP_PROGRESS[st.session_state.step])
+        st.markdown(STEP_LABELS[st.session_state.step])
     
     # Route to appropriate page based on state
     if st.session_state.generated_plan is not None:
@@ -80,24 +71,10 @@ def main():
             display_calendar()
         else:
             display_results()
-    elif st.session_state.step == 1:
-        step_1()
-    elif st.session_state.step == 2:
-        step_2()
-    elif st.session_state.step == 3:
-        step_3()
-    elif st.session_state.step == 4:
-        step_4()
-    elif st.session_state.step == 5:
-        step_5()
-    elif st.session_state.step == 6:
-        step_6()
-    elif st.session_state.step == 7:
-        step_7()
-    elif st.session_state.step == 8:
-        step_8()
-    elif st.session_state.step == 9:
-        step_9()
+    else:
+        step_func = STEP_FUNCS.get(st.session_state.step)
+        if step_func:
+            step_func()
     
     # Display footer
     display_footer()
@@ -4,6 +4,8 @@ import uuid
 import json
 import os
 import calendar
+from functools import lru_cache
+from types import MappingProxyType
 
 def generate_google_calendar_link(milestone_id=None):
     """
@@ -124,6 +126,68 @@ def delete_milestone(milestone_id):
     # Return True if a milestone was deleted
     return len(st.session_state.session_milestones) < original_length
 
+# (pre-launch weeks, post-launch weeks) by funding status marker, checked in order
+FUNDING_TIMELINE_WEEKS = {
+    "Bootstrapping": (4, 4),  # Shorter timeline for bootstrapped companies (8 weeks)
+    "under $1M": (5, 5)  # Medium timeline (10 weeks)
+}
+
+# Longer timeline for well-funded companies (12 weeks)
+DEFAULT_TIMELINE_WEEKS = (6, 6)
+
+# Milestones suggested for every launch; dates are set relative to the funding timeline
+BASE_MILESTONES = (
+    MappingProxyType({
+        "name": "Messaging Validation Complete",
+        "description": "Complete customer interviews and messaging validation",
+        "type": "pre-launch"
+    }),
+    MappingProxyType({
+        "name": "Content Creation Deadline",
+        "description": "Finalize all launch content, including website, social media posts, and press materials",
+        "type": "pre-launch"
+    }),
+    MappingProxyType({
+        "name": "Launch Day",
+        "description": "Official {launch_type} launch date",
+        "type": "launch"
+    }),
+    MappingProxyType({
+        "name": "Post-Launch Analysis",
+        "description": "Analyze initial launch metrics and adjust strategy",
+        "type": "post-launch"
+    }),
+    MappingProxyType({
+        "name": "Growth Strategy Implementation",
+        "description": "Implement ongoing growth strategy based on launch results",
+        "type": "post-launch"
+    })
+)
+
+# Extra pre-launch milestone by launch type marker, checked in order
+LAUNCH_TYPE_MILESTONES = {
+    "New Startup/Product Launch": MappingProxyType({
+        "name": "Beta User Feedback Session",
+        "description": "Collect feedback from beta users to refine product",
+        "type": "pre-launch"
+    }),
+    "Brand Repositioning": MappingProxyType({
+        "name": "Stakeholder Communication",
+        "description": "Communicate rebranding to key stakeholders and team",
+        "type": "pre-launch"
+    }),
+    "Funding Announcement": MappingProxyType({
+        "name": "Investor Relations Setup",
+        "description": "Prepare investor relations materials and communications",
+        "type": "pre-launch"
+    }),
+    "Partnership": MappingProxyType({
+        "name": "Partner Coordination Meeting",
+        "description": "Coordinate launch activities with partnership team",
+        "type": "pre-launch"
+    })
+}
+
 def create_suggested_milestones(launch_plan):
     """
     Create suggested milestones based on the launch plan
@@ -132,7 +196,7 @@ def create_suggested_milestones(launch_plan):
         launch_plan (dict): The generated launch plan
         
     Returns:
-        list: List of suggested milestone dicts
+        tuple: Read-only suggested milestone mappings
     """
     # Get launch type and funding status with fallbacks
     launch_type = "New Startup/Product Launch"
@@ -151,94 +215,52 @@ def create_suggested_milestones(launch_plan):
         funding_status = launch_plan.get("funding_status", funding_status)
     
     # Base date is today
-    today = datetime.date.today()
+    return _suggested_milestones(launch_type, funding_status, datetime.date.today())
+
+@lru_cache(maxsize=32)
+def _suggested_milestones(launch_type, funding_status, today):
+    """
+    Build the suggested milestones for a launch type and funding status
+    
+    Cached because the calendar tab calls this on every rerun; today is part of
+    the key so the dates roll over correctly.
     
+    Returns:
+        tuple: Read-only milestone mappings
+    """
     # Create different timeline based on funding status
-    if "Bootstrapping" in funding_status:
-        # Shorter timeline for bootstrapped companies (8 weeks)
-        pre_launch_weeks = 4
-        launch_day = today + datetime.timedelta(weeks=pre_launch_weeks)
-        post_launch_weeks = 4
-    elif "under $1M" in funding_status:
-        # Medium timeline (10 weeks)
-        pre_launch_weeks = 5
-        launch_day = today + datetime.timedelta(weeks=pre_launch_weeks)
-        post_launch_weeks = 5
-    else:
-        # Longer timeline for well-funded companies (12 weeks)
-        pre_launch_weeks = 6
-        launch_day = today + datetime.timedelta(weeks=pre_launch_weeks)
-        post_launch_weeks = 6
-    
-    # Create a list of suggested milestones
-    suggested_milestones = [
-        {
-            "name": "Messaging Validation Complete",
-            "date": today + datetime.timedelta(weeks=1),
-            "description": "Complete customer interviews and messaging validation",
-            "type": "pre-launch"
-        },
-        {
-            "name": "Content Creation Deadline",
-            "date": today + datetime.timedelta(weeks=pre_launch_weeks-2),
-            "description": "Finalize all launch content, including website, social media posts, and press materials",
-            "type": "pre-launch"
-        },
-        {
-            "name": "Launch Day",
-            "date": launch_day,
-            "description": f"Official {launch_type.strip('🔄 🚀 💰 📢')} launch date",
-            "type": "launch"
-        },
-        {
-            "name": "Post-Launch Analysis",
-            "date": launch_day + datetime.timedelta(weeks=1),
-            "description": "Analyze initial launch metrics and adjust strategy",
-            "type": "post-launch"
-        },
-        {
-            "name": "Growth Strategy Implementation",
-            "date": launch_day + datetime.timedelta(weeks=post_launch_weeks),
-            "description": "Implement ongoing growth strategy based on launch results",
-            "type": "post-launch"
-        }
-    ]
+    pre_launch_weeks, post_launch_weeks = next(
+        (weeks for marker, weeks in FUNDING_TIMELINE_WEEKS.items() if marker in funding_status),
+        DEFAULT_TIMELINE_WEEKS
+    )
+    
+    # Pair each milestone template with its offset in weeks from today
+    dated_milestones = list(zip(BASE_MILESTONES, (
+        1,
+        pre_launch_weeks - 2,
+        pre_launch_weeks,  # Launch day
+        pre_launch_weeks + 1,
+        pre_launch_weeks + post_launch_weeks
+    )))
     
     # Add launch type specific milestones
-    if "New Startup/Product Launch" in launch_type:
-        suggested_milestones.append({
-            "name": "Beta User Feedback Session",
-            "date": today + datetime.timedelta(weeks=2),
-            "description": "Collect feedback from beta users to refine product",
-            "type": "pre-launch"
-        })
-    elif "Brand Repositioning" in launch_type:
-        suggested_milestones.append({
-            "name": "Stakeholder Communication",
-            "date": today + datetime.timedelta(weeks=2),
-            "description": "Communicate rebranding to key stakeholders and team",
-            "type": "pre-launch"
-        })
-    elif "Funding Announcement" in launch_type:
-        suggested_milestones.append({
-            "name": "Investor Relations Setup",
-            "date": today + datetime.timedelta(weeks=2),
-            "description": "Prepare investor relations materials and communications",
-            "type": "pre-launch"
-        })
-    elif "Partnership" in launch_type:
-        suggested_milestones.append({
-            "name": "Partner Coordination Meeting",
-            "date": today + datetime.timedelta(weeks=2),
-            "description": "Coordinate launch activities with partnership team",
-            "type": "pre-launch"
+    type_milestone = next(
+        (milestone for marker, milestone in LAUNCH_TYPE_MILESTONES.items() if marker in launch_type),
+        None
+    )
+    if type_milestone:
+        dated_milestones.append((type_milestone, 2))
+    
+    # Fill in the dates (formatted as strings for display) and the launch name
+    launch_name = launch_type.strip('🔄 🚀 💰 📢')
+    return tuple(
+        MappingProxyType({
+            **milestone,
+            "date": (today + datetime.timedelta(weeks=weeks)).strftime("%Y-%m-%d"),
+            "description": milestone["description"].format(launch_type=launch_name)
         })
-    
-    # Format dates as strings for display
-    for milestone in suggested_milestones:
-        milestone["date"] = milestone["date"].strftime("%Y-%m-%d")
-    
-    return suggested_milestones
+        for milestone, weeks in dated_milestones
+    )
 
 def display_improved_timeline(milestones, deletable=False):
     """
@@ -142,25 +142,23 @@ def display_competitive_analysis(launch_type=None, funding_status=None, selected
     # Display company examples
     for i, company in enumerate(similar_companies):
         with st.expander(f"{company['company']} ({company['launch_year']})", expanded=i==0):
-            col1, col2 = st.columns([2, 1])
-            
-            with col1:
-                st.markdown(f"**Launch Approach:** {company['approach']}")
-                st.markdown(f"**Funding at Launch:** {company['funding_at_launch']}")
-                
-                # Key strategies
-                st.markdown("**Key Strategies:**")
-                for strategy in company['key_strategies']:
-                    st.markdown(f"- {strategy}")
-                
-                st.markdown(f"**Results:** {company['results']}")
-            
-            with col2:
-                st.markdown("**Notable Tactic:**")
-                st.markdown(f"_{company['notable_tactics']}_")
-                
-                st.markdown("**Key Insight:**")
-                st.markdown(f"_{company['retrospective_insight']}_")
+            # Render both columns as a single CSS grid block
+            strategies_html = "".join(f"<li>{strategy}</li>" for strategy in company['key_strategies'])
+            st.markdown(
+                '<div class="company-grid">'
+                '<div>'
+                f"<p><strong>Launch Approach:</strong> {company['approach']}</p>"
+                f"<p><strong>Funding at Launch:</strong> {company['funding_at_launch']}</p>"
+                f"<p><strong>Key Strategies:</strong></p><ul>{strategies_html}</ul>"
+                f"<p><strong>Results:</strong> {company['results']}</p>"
+                '</div>'
+                '<div>'
+                f"<p><strong>Notable Tactic:</strong></p><p><em>{company['notable_tactics']}</em></p>"
+                f"<p><strong>Key Insight:</strong></p><p><em>{company['retrospective_insight']}</em></p>"
+                '</div>'
+                '</div>',
+                unsafe_allow_html=True
+            )
     
     # Add section for key takeaways
     st.markdown("### Key Takeaways from Successful Launches")
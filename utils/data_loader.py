@@ -1,7 +1,11 @@
+import hashlib
 import json
 import os
+import tempfile
+import time
 import streamlit as st
 
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60)
 def load_strategies():
     """Load strategies from JSON file if it exists"""
     try:
@@ -11,4 +15,53 @@ def load_strategies():
         return None
     except Exception as e:
         st.error(f"Error loading strategies: {e}")
-        return None
\ No newline at end of file
+        return None
+
+# On-disk plan cache so identical answers survive a server restart
+PLAN_CACHE_DIR = os.path.join(".cache", "plans")
+PLAN_CACHE_TTL = 7 * 24 * 60 * 60
+
+def plan_cache_key(form_data):
+    """Return a stable hash of the form answers for use as a plan cache key"""
+    return hashlib.sha1(json.dumps(form_data, sort_keys=True).encode()).hexdigest()
+
+def load_cached_plan(key):
+    """Load a previously generated plan from disk, or None if missing or expired"""
+    path = os.path.join(PLAN_CACHE_DIR, f"{key}.json")
+    try:
+        if time.time() - os.path.getmtime(path) > PLAN_CACHE_TTL:
+            # Expired plans hold the founder's details, so delete rather than keep them
+            os.remove(path)
+            return None
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _prune_cached_plans():
+    """Delete cached plans older than PLAN_CACHE_TTL"""
+    cutoff = time.time() - PLAN_CACHE_TTL
+    for entry in os.scandir(PLAN_CACHE_DIR):
+        try:
+            if entry.name.endswith(".json") and entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+def save_cached_plan(key, plan):
+    """Write a generated plan to disk; failures are ignored since the cache is best effort"""
+    path = os.path.join(PLAN_CACHE_DIR, f"{key}.json")
+    tmp_path = None
+    try:
+        os.makedirs(PLAN_CACHE_DIR, exist_ok=True)
+        _prune_cached_plans()
+        fd, tmp_path = tempfile.mkstemp(dir=PLAN_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(plan, f)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError):
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
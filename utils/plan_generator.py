@@ -2,6 +2,8 @@ import json
 import os
 import streamlit as st
 import re
+from functools import lru_cache
+from types import MappingProxyType
 
 # Try to import OpenAI in different ways based on version
 try:
@@ -15,6 +17,72 @@ except ImportError:
     openai.api_key = st.secrets["openai"]["api_key"]
     USE_LEGACY_OPENAI = True
 
+# Patterns for parsing the AI response, compiled once at import
+MESSAGING_RE = re.compile(r"Messaging Advice:(.*?)(?=Recommended Strategies:|$)", re.DOTALL)
+STRATEGIES_RE = re.compile(r"Recommended Strategies:(.*?)(?=Next Steps:|$)", re.DOTALL)
+NEXT_STEPS_RE = re.compile(r"Next Steps:(.*?)$", re.DOTALL)
+NUMBERED_ITEM_RE = re.compile(r'\d+\.\s+(.*?)(?=\d+\.|$)', re.DOTALL)
+BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+
+def _freeze(obj):
+    """Recursively convert dicts to read-only mappings and lists to tuples"""
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(value) for value in obj)
+    return obj
+
+def _flatten(nested):
+    """Flatten a three-level mapping into a dict keyed by (level1, level2, level3) tuples"""
+    return {
+        (first, second, third): items
+        for first, by_second in nested.items()
+        for second, by_third in by_second.items()
+        for third, items in by_third.items()
+    }
+
+_DEFAULT_STRATEGIES = (
+    "Create a compelling story that connects your mission to customer needs",
+    "Focus on 1-2 high-impact marketing channels that align with your resources",
+    "Build relationships with influencers and partners in your industry"
+)
+
+_DEFAULT_NEXT_STEPS = (
+    "Document what worked and what didn't in your launch",
+    "Focus on optimizing your best-performing channel",
+    "Create a 30-day action plan based on initial results"
+)
+
+# Hardcoded strategies and next steps, in the same format as data/strategies.json
+DEFAULT_STRATEGIES_PATH = "data/default_strategies.json"
+
+@lru_cache(maxsize=1)
+def _read_defaults():
+    """
+    Read the hardcoded strategies and next steps on first use
+    
+    Read errors propagate, and lru_cache does not cache raised exceptions,
+    so a failed read is retried on the next call.
+    
+    Returns:
+        dict: 'launch_strategies' and 'next_steps' as flat lookup tables keyed by
+            the three answers, with tuple values
+    """
+    with open(DEFAULT_STRATEGIES_PATH, "r", encoding="utf-8") as f:
+        defaults = json.load(f)
+    return {
+        'launch_strategies': _flatten(_freeze(defaults.get('launch_strategies', {}))),
+        'next_steps': _flatten(_freeze(defaults.get('next_steps', {})))
+    }
+
+def _load_defaults():
+    """Return the cached default lookup tables, or empty tables if the file cannot be read"""
+    try:
+        return _read_defaults()
+    except (OSError, ValueError) as e:
+        st.error(f"Error loading default strategies: {e}")
+        return {'launch_strategies': {}, 'next_steps': {}}
+
 def parse_ai_response(ai_text):
     """
     Parse the AI generated text into structured data
@@ -33,22 +101,22 @@ def parse_ai_response(ai_text):
     }
     
     # Extract messaging advice
-    messaging_match = re.search(r"Messaging Advice:(.*?)(?=Recommended Strategies:|$)", ai_text, re.DOTALL)
+    messaging_match = MESSAGING_RE.search(ai_text)
     if messaging_match:
         result['messaging_advice'] = messaging_match.group(1).strip()
     
     # Extract strategies
-    strategies_match = re.search(r"Recommended Strategies:(.*?)(?=Next Steps:|$)", ai_text, re.DOTALL)
+    strategies_match = STRATEGIES_RE.search(ai_text)
     if strategies_match:
         strategies_text = strategies_match.group(1).strip()
         # Split by numbered items (1., 2., 3., etc.)
-        strategies = re.findall(r'\d+\.\s+(.*?)(?=\d+\.|$)', strategies_text + "999.", re.DOTALL)
+        strategies = NUMBERED_ITEM_RE.findall(strategies_text + "999.")
         
         # Clean up strategies - remove markdown formatting
         clean_strategies = []
         for s in strategies:
             # Remove **text** markdown formatting
-            cleaned = re.sub(r'\*\*(.*?)\*\*', r'\1', s.strip())
+            cleaned = BOLD_RE.sub(r'\1', s.strip())
             clean_strategies.append(cleaned)
             
         result['recommended_strategies'] = clean_strategies
@@ -66,17 +134,17 @@ def parse_ai_response(ai_text):
             })
     
     # Extract next steps
-    next_steps_match = re.search(r"Next Steps:(.*?)$", ai_text, re.DOTALL)
+    next_steps_match = NEXT_STEPS_RE.search(ai_text)
     if next_steps_match:
         next_steps_text = next_steps_match.group(1).strip()
         # Split by numbered items (1., 2., 3., etc.)
-        next_steps = re.findall(r'\d+\.\s+(.*?)(?=\d+\.|$)', next_steps_text + "999.", re.DOTALL)
+        next_steps = NUMBERED_ITEM_RE.findall(next_steps_text + "999.")
         
         # Clean up next steps - remove markdown formatting
         clean_next_steps = []
         for ns in next_steps:
             # Remove **text** markdown formatting
-            cleaned = re.sub(r'\*\*(.*?)\*\*', r'\1', ns.strip())
+            cleaned = BOLD_RE.sub(r'\1', ns.strip())
             clean_next_steps.append(cleaned)
         
         # Also add structured format for consistency
@@ -191,16 +259,17 @@ Use a confident, direct, and founder-to-founder tone.
     
     return plan
 
-def generate_launch_plan(form_data, external_strategies=None):
-    # Use AI-powered generation if OpenAI credentials are present
-    try:
-        if "openai" in st.secrets and "api_key" in st.secrets["openai"]:
-            return generate_ai_launch_plan(form_data, external_strategies)
-    except Exception as e:
-        st.error(f"Error using AI generation: {e}")
-        # Fall back to static generation if AI generation fails
+def generate_static_launch_plan(form_data, external_strategies=None):
+    """
+    Build a launch plan from the static strategies, without calling the AI model
+    
+    Args:
+        form_data (dict): User inputs from the multi-step form.
+        external_strategies (dict, optional): Strategies loaded from data/strategies.json.
         
-    # Fallback to your static generation logic
+    Returns:
+        dict: A plan dictionary in the same structure as the AI-generated plan.
+    """
     messaging_advice = get_messaging_advice(form_data['messaging_tested'])
     strategies = get_launch_strategies(
         form_data['launch_type'], 
@@ -248,7 +317,7 @@ def generate_launch_plan(form_data, external_strategies=None):
             'funding_status': form_data['funding_status'],
             'primary_goal': form_data['primary_goal']
         },
-        'recommended_strategies': strategies,
+        'recommended_strategies': list(strategies),
         'strategies': structured_strategies,
         'next_steps': structured_next_steps
     }
@@ -279,100 +348,8 @@ def get_launch_strategies(launch_type, funding_status, primary_goal, external_st
             # If the combination doesn't exist in external file, fall back to hardcoded
             pass
 
-    # Clean inputs by removing emojis if present
-    clean_launch_type = launch_type
-    clean_funding_status = funding_status
-    clean_primary_goal = primary_goal
-    
-    # Also try with emoji
-    emoji_strategies = {
-        "🚀 New Startup/Product Launch": {
-            "🚀 Bootstrapping (No external funding, self-funded)": {
-                "🚀 Get Users or Customers": [
-                    "Focus on founder-led storytelling through guest podcasts and social content",
-                    "Create a limited beta program with exclusive perks to drive early adoption",
-                    "Build direct relationships with early users for feedback and testimonials"
-                ],
-                "💰 Attract Investors": [
-                    "Document your traction journey publicly to showcase momentum",
-                    "Create case studies showing early customer impact",
-                    "Target niche industry events where investors in your space gather"
-                ],
-                "🎙 Build Press & Awareness": [
-                    "Craft a compelling founder story that ties to current trends",
-                    "Pitch to industry-specific publications rather than mainstream media",
-                    "Create shareable content that showcases your unique approach"
-                ],
-                "🌎 Create Industry Influence": [
-                    "Start a focused content series solving key problems in your industry",
-                    "Join relevant communities as a contributor, not just a promoter",
-                    "Collaborate with complementary startups for wider reach"
-                ]
-            },
-            "🌱 Raised under $1M": {
-                "🚀 Get Users or Customers": [
-                    "Run targeted ad experiments to identify high-converting messages",
-                    "Create an exclusive waitlist with referral incentives",
-                    "Partner with complementary products for shared launches"
-                ],
-                "💰 Attract Investors": [
-                    "Build a data-driven pitch showing early traction metrics",
-                    "Create investor-specific content demonstrating market understanding",
-                    "Get warm introductions through strategic advisory relationships"
-                ],
-                "🎙 Build Press & Awareness": [
-                    "Position your funding as validation for a larger trend story",
-                    "Create data-driven content that journalists can easily reference",
-                    "Build relationships with 3-5 key reporters in your space"
-                ],
-                "🌎 Create Industry Influence": [
-                    "Participate in industry panels and speaking opportunities",
-                    "Launch a small but high-quality thought leadership publication",
-                    "Create a community initiative that positions you as a connector"
-                ]
-            }
-        },
-        "New Startup/Product Launch": {
-            "Bootstrapping (No external funding)": {
-                "Get Users or Customers": [
-                    "Focus on founder-led storytelling through guest podcasts and social content",
-                    "Create a limited beta program with exclusive perks to drive early adoption",
-                    "Build direct relationships with early users for feedback and testimonials"
-                ],
-                "Attract Investors": [
-                    "Document your traction journey publicly to showcase momentum",
-                    "Create case studies showing early customer impact",
-                    "Target niche industry events where investors in your space gather"
-                ],
-                "Build Press & Awareness": [
-                    "Craft a compelling founder story that ties to current trends",
-                    "Pitch to industry-specific publications rather than mainstream media",
-                    "Create shareable content that showcases your unique approach"
-                ],
-                "Create Industry Influence": [
-                    "Start a focused content series solving key problems in your industry",
-                    "Join relevant communities as a contributor, not just a promoter",
-                    "Collaborate with complementary startups for wider reach"
-                ]
-            }
-        }
-    }
-    
-    # Try to get strategies with emoji first
-    try:
-        return emoji_strategies[launch_type][funding_status][primary_goal]
-    except KeyError:
-        pass
-        
-    # Try common fallback strategies
-    fallback_strategies = [
-        "Create a compelling story that connects your mission to customer needs",
-        "Focus on 1-2 high-impact marketing channels that align with your resources",
-        "Build relationships with influencers and partners in your industry"
-    ]
-    
-    # Return default fallback strategies
-    return fallback_strategies
+    # Try the hardcoded strategies, falling back to the defaults
+    return _load_defaults()['launch_strategies'].get((launch_type, funding_status, primary_goal), _DEFAULT_STRATEGIES)
 
 def get_next_steps(funding_status, audience_readiness, post_launch_priority, external_strategies=None):
     """
@@ -390,45 +367,5 @@ def get_next_steps(funding_status, audience_readiness, post_launch_priority, ext
             # If the combination doesn't exist in external file, fall back to hardcoded
             pass
 
-    # Emoji-based next steps
-    emoji_next_steps = {
-        "🚀 Bootstrapping (No external funding, self-funded)": {
-            "✅ Yes, we have an engaged community": {
-                "📈 Scaling & repeatable traction": [
-                    "Analyze which launch channels delivered highest ROI",
-                    "Document repeatable processes for your best-performing channels",
-                    "Create a lean content calendar focused on high-conversion topics"
-                ],
-                "💰 Investor relations": [
-                    "Build a simple investor update template highlighting key metrics",
-                    "Identify 10-15 potential angels or micro-VCs aligned with your vision",
-                    "Create a basic pitch deck focused on traction and capital efficiency"
-                ],
-                "🛠 Optimizing based on customer feedback": [
-                    "Implement a simple feedback collection system",
-                    "Identify the top 3 points of friction in your current experience",
-                    "Create a weekly iteration schedule focused on quick wins"
-                ],
-                "🔥 Sustaining press & industry visibility": [
-                    "Develop a simple PR calendar with monthly goals",
-                    "Create a content repurposing system to maximize reach",
-                    "Join 3-5 communities where your audience gathers"
-                ]
-            }
-        }
-    }
-    
-    # Try to get next steps with emoji first
-    try:
-        return emoji_next_steps[funding_status][audience_readiness][post_launch_priority]
-    except KeyError:
-        pass
-    
-    # Default next steps as fallback
-    fallback_next_steps = [
-        "Document what worked and what didn't in your launch",
-        "Focus on optimizing your best-performing channel",
-        "Create a 30-day action plan based on initial results"
-    ]
-    
-    return fallback_next_steps
\ No newline at end of file
+    # Try the hardcoded next steps, falling back to the defaults
+    return _load_defaults()['next_steps'].get((funding_status, audience_readiness, post_launch_priority), _DEFAULT_NEXT_STEPS)
\ No newline at end of file
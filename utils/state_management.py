@@ -1,19 +1,42 @@
 import streamlit as st
 
+# Blank questionnaire answers
+DEFAULT_FORM_DATA = {
+    'first_name': '',
+    'startup_name': '',
+    'messaging_tested': None,
+    'launch_type': None,
+    'funding_status': None,
+    'primary_goal': None,
+    'audience_readiness': None,
+    'post_launch_priority': None,
+    'industry': None,
+    'email': ''
+}
+
+# Initial session state; form_data is filled from DEFAULT_FORM_DATA
+DEFAULT_STATE = {
+    'step': 1,
+    'form_data': None,
+    'generated_plan': None,
+    'email_sent': False,
+    'show_calendar': False
+}
+
+def init_session_state():
+    """Populate any missing session state keys with their defaults"""
+    for key, value in DEFAULT_STATE.items():
+        st.session_state.setdefault(key, value)
+    if st.session_state.form_data is None:
+        st.session_state.form_data = DEFAULT_FORM_DATA.copy()
+
+def set_show_calendar(show):
+    """Toggle between the launch plan and the calendar view (used as a button callback)"""
+    st.session_state.show_calendar = show
+
 def reset_form():
     """Reset the form to start over"""
-    st.session_state.form_data = {
-        'first_name': '',
-        'startup_name': '',
-        'messaging_tested': None,
-        'launch_type': None,
-        'funding_status': None,
-        'primary_goal': None,
-        'audience_readiness': None,
-        'post_launch_priority': None,
-        'industry': None,
-        'email': ''
-    }
+    st.session_state.form_data = DEFAULT_FORM_DATA.copy()
     st.session_state.generated_plan = None
     st.session_state.email_sent = False
     st.session_state.show_calendar = False
@@ -135,15 +135,26 @@ def display_info_for_option(option):
     st.markdown('</div>', unsafe_allow_html=True)
 
 
+def _go_back():
+    """Move the form back one step"""
+    st.session_state.step -= 1
+
+def _go_next():
+    """Move the form forward one step"""
+    st.session_state.step += 1
+
 def step_navigation(back=True, next_label="Next →", next_disabled=True, on_next=None):
     """
     Create navigation buttons with Back and Next side by side at the bottom
     
+    The buttons use on_click callbacks, so the step change is applied before
+    Streamlit's automatic rerun and no explicit rerun is needed.
+    
     Args:
         back (bool): Whether to show back button
         next_label (str): Label for the next button
         next_disabled (bool): Whether next button should be disabled
-        on_next (function, optional): Function to call on next
+        on_next (function, optional): Callback to run when Next is clicked
     """
     # Add some space before the navigation buttons
     st.write("")
@@ -153,25 +164,15 @@ def step_navigation(back=True, next_label="Next →", next_disabled=True, on_nex
     if back:
         col1, col2 = st.columns(2)
         with col1:
-            if st.button("← Back", key="back_button", use_container_width=True):
-                st.session_state.step -= 1
-                st.experimental_rerun()
+            st.button("← Back", key="back_button", use_container_width=True, on_click=_go_back)
         
         with col2:
-            if st.button(next_label, disabled=next_disabled, key="next_button", use_container_width=True):
-                if on_next:
-                    on_next()
-                else:
-                    st.session_state.step += 1
-                    st.experimental_rerun()
+            st.button(next_label, disabled=next_disabled, key="next_button", use_container_width=True,
+                      on_click=on_next or _go_next)
     else:
         # If no back button needed, only show Next button full width
-        if st.button(next_label, disabled=next_disabled, key="next_button", use_container_width=True):
-            if on_next:
-                on_next()
-            else:
-                st.session_state.step += 1
-                st.experimental_rerun()
+        st.button(next_label, disabled=next_disabled, key="next_button", use_container_width=True,
+                  on_click=on_next or _go_next)
 
 def step_card(title, content_func):
     """
@@ -191,45 +192,39 @@ def step_card(title, content_func):
 
 def pricing_section():
     """Display the pricing options grid with clickable links"""
-    st.markdown('<div class="pricing-grid">', unsafe_allow_html=True)
-    
-    # DIY Option
     st.markdown(
+        '<div class="pricing-grid">'
+        
+        # DIY Option
         '<a href="https://www.moxieaibrands.com/diy-launch" target="_blank" style="text-decoration: none; color: inherit;">'
         '<div class="pricing-card">'
         '<p class="pricing-title">DIY</p>'
         '<p class="pricing-price">$29/month</p>'
         '<p class="pricing-description">Weekly roadmap</p>'
         '</div>'
-        '</a>',
-        unsafe_allow_html=True
-    )
-    
-    # Coaching Option (highlighted)
-    st.markdown(
+        '</a>'
+        
+        # Coaching Option (highlighted)
         '<a href="https://www.moxieaibrands.com/launch-coach" target="_blank" style="text-decoration: none; color: inherit;">'
         '<div class="pricing-card highlighted">'
         '<p class="pricing-title">Coaching</p>'
         '<p class="pricing-price">$500/month</p>'
         '<p class="pricing-description">Direct guidance</p>'
         '</div>'
-        '</a>',
-        unsafe_allow_html=True
-    )
-    
-    # Full-Service Option with updated text
-    st.markdown(
+        '</a>'
+        
+        # Full-Service Option with updated text
         '<a href="https://www.moxieaibrands.com/high-impact-launch" target="_blank" style="text-decoration: none; color: inherit;">'
         '<div class="pricing-card">'
         '<p class="pricing-title">Full-Service</p>'
         '<p class="pricing-price">$5K/mo</p>'
         '<p class="pricing-description">Typically 3-6 months to launch</p>'
         '</div>'
-        '</a>',
+        '</a>'
+        
+        '</div>',
         unsafe_allow_html=True
     )
-    
-    st.markdown('</div>', unsafe_allow_html=True)
 
 def info_box(text):
     """Display a consistent info box"""